@@ -17,6 +17,7 @@ Usage:
     python generator.py --jd-file job_description.txt      # From file (auto-detects company)
     python generator.py --jd "Job description text..."     # Direct text (auto-detects company)
     python generator.py --company "ServiceNow"             # Override auto-detected company name
+    python generator.py --jd-file jd.txt --parallel        # Fan-out: one request per section
 """
 
 import os
@@ -25,6 +26,7 @@ import yaml
 import argparse
 import google.generativeai as genai
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # ANSI colors
 class Colors:
@@ -35,6 +37,20 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Sections generated concurrently in parallel mode, in assembly order.
+# Each maps to the YAML keys its response must contain.
+PARALLEL_SECTIONS = {
+    'summary': ['title', 'summary'],
+    'skills': ['skills'],
+    'lseg': ['bullets'],
+    'infosys': ['bullets'],
+    'projects': ['projects'],
+}
+
+LSEG_COMPANY = "London Stock Exchange Group (LSEG)"
+INFOSYS_COMPANY = "Infosys"
+
+
 class YAMLGenerator:
     def __init__(self, company_name: str = None):
         self.script_dir = Path(__file__).parent.resolve()
@@ -273,24 +289,248 @@ OUTPUT THE YAML NOW:
             print(f"{Colors.BLUE}This may take 60-90 seconds...{Colors.END}\n")
             
             response = self.model.generate_content(prompt)
-            generated_yaml = response.text
-            
-            # Strip markdown code blocks if present
-            if '```yaml' in generated_yaml:
-                generated_yaml = generated_yaml.split('```yaml')[1].split('```')[0].strip()
-            elif '```' in generated_yaml:
-                # Try to find yaml block
-                parts = generated_yaml.split('```')
-                for i, part in enumerate(parts):
-                    if 'header:' in part:
-                        generated_yaml = part.strip()
-                        break
-            
-            return generated_yaml
+            return self._extract_yaml_block(response.text, 'header:')
             
         except Exception as e:
             print(f"{Colors.RED}ERROR during generation: {e}{Colors.END}")
             return None
+
+    @staticmethod
+    def _extract_yaml_block(text: str, marker: str) -> str:
+        """Strip markdown code fences, keeping the block that contains marker"""
+        if '```yaml' in text:
+            return text.split('```yaml')[1].split('```')[0].strip()
+        if '```' in text:
+            # Try to find yaml block
+            for part in text.split('```'):
+                if marker in part:
+                    return part.strip()
+        return text.strip()
+
+    def _section_constraints(self) -> dict:
+        """Parsed constraints.yaml (self.constraints holds the raw text for prompts)"""
+        try:
+            return yaml.safe_load(self.constraints) or {}
+        except yaml.YAMLError:
+            return {}
+
+    def _build_section_prompts(self) -> dict:
+        """Build one small, section-specific prompt per parallel section"""
+        constraints = self._section_constraints()
+        summary_c = constraints.get('summary', {})
+        skills_c = constraints.get('skills', {})
+        companies = constraints.get('experience', {}).get('companies', {})
+        lseg_c = companies.get(LSEG_COMPANY, {})
+        infosys_c = companies.get(INFOSYS_COMPANY, {})
+        projects_c = constraints.get('projects', {})
+
+        context = f"""You are an expert resume writer generating ONE section of a tailored resume YAML.
+
+JOB DESCRIPTION:
+{self.jd_text}
+
+TARGET COMPANY: {self.company_name}
+
+USER PROFILE DATABASE (ALL facts must come from here - no fabrication):
+{self.profile_data}
+
+RULES:
+- Character limits EXCLUDE the ** bold markers
+- Bold markers: Use ** syntax around key terms
+- Use natural language (not keyword-stuffed)
+- Output ONLY valid YAML in a ```yaml block, no explanations
+"""
+
+        def bullet_rules(c: dict) -> str:
+            return (f"EXACTLY {c.get('exact_bullets', 0)} bullets, "
+                    f"{c.get('bullet_min_chars', 0)}-{c.get('bullet_max_chars', 250)} characters each, "
+                    f"{c.get('bullet_min_bold', 3)}-{c.get('bullet_max_bold', 5)} bold markers each")
+
+        required_keywords = ', '.join(f'"{k}"' for k in summary_c.get('required_keywords', []))
+
+        return {
+            'summary': context + f"""
+SECTION: HEADER TITLE + SUMMARY
+- title: "[Role from JD] | MS CS @ Northeastern | [Top 3-5 JD keywords]", max 100 characters
+- summary: {summary_c.get('min_chars', 450)}-{summary_c.get('max_chars', 520)} characters, {summary_c.get('min_bold', 5)}-{summary_c.get('max_bold', 8)} bold markers
+- summary MUST contain: {required_keywords}
+- Format: "MS Computer Science student at Northeastern (**3.89 GPA**, Graduating **May 2027**), **F-1 CPT/OPT** eligible, available for **Summer 2026** internship. [Experience focus at **London Stock Exchange Group**]. [2-3 technical highlights matching JD]. [1 key achievement with metric]. Excited to [company-specific value proposition at **{self.company_name}**]."
+
+OUTPUT FORMAT:
+```yaml
+title: "..."
+summary: "..."
+```
+""",
+            'skills': context + f"""
+SECTION: TECHNICAL SKILLS
+- EXACTLY {skills_c.get('exact_categories', 7)} categories, ordered by JD priority (most important first)
+- category name max {skills_c.get('category_name_max_chars', 30)} characters
+- items max {skills_c.get('items_max_chars', 82)} characters, comma-separated, no bold markers
+- Include all critical JD keywords the profile supports; use actual skills from the profile only
+
+OUTPUT FORMAT:
+```yaml
+skills:
+  - category: "..."
+    items: "..."
+```
+""",
+            'lseg': context + f"""
+SECTION: {LSEG_COMPANY} EXPERIENCE BULLETS
+- {bullet_rules(lseg_c)}
+- Use real metrics from profile: 7.5M+ records, 180+ countries, 40 records/sec, 99.9% uptime, 35-40% improvements, 5 engineers, 7 teams
+- Technologies: Python, Java, AWS Lambda/SQS/API Gateway, microservices, event-driven
+- Match JD keywords naturally
+
+OUTPUT FORMAT:
+```yaml
+bullets:
+  - "..."
+```
+""",
+            'infosys': context + f"""
+SECTION: {INFOSYS_COMPANY} EXPERIENCE BULLETS
+- {bullet_rules(infosys_c)}
+- Use real metrics: 3x throughput, 50% reduction, 35% latency, 20% accuracy
+- Technologies: Python, ETL, microservices, APIs, databases
+- Complement (do not repeat) the LSEG experience; fill gaps in JD coverage
+
+OUTPUT FORMAT:
+```yaml
+bullets:
+  - "..."
+```
+""",
+            'projects': context + f"""
+SECTION: PROJECTS
+- Select EXACTLY {projects_c.get('exact_count', 3)} most relevant projects from the profile (tech stack match, role alignment)
+- title: project name exactly as in the profile portfolio
+- tech: max {projects_c.get('tech_max_chars', 80)} characters
+- github: "GitHub"
+- bullet1, bullet2: max {projects_c.get('bullet_max_chars', 250)} characters each, {projects_c.get('bullet_min_bold', 3)}-{projects_c.get('bullet_max_bold', 5)} bold markers each
+- Emphasize JD-relevant aspects with real metrics from the profile
+
+OUTPUT FORMAT:
+```yaml
+projects:
+  - title: "..."
+    tech: "..."
+    github: "GitHub"
+    bullet1: "..."
+    bullet2: "..."
+```
+""",
+        }
+
+    def _generate_section(self, name: str, prompt: str):
+        """Generate and parse a single section, retrying once on malformed output"""
+        expected_keys = PARALLEL_SECTIONS[name]
+        for attempt in range(2):
+            try:
+                response = self.model.generate_content(prompt)
+                fragment = yaml.safe_load(self._extract_yaml_block(response.text, f'{expected_keys[0]}:'))
+                error = self._check_section(name, fragment)
+                if not error:
+                    return fragment, None
+            except Exception as e:
+                error = str(e)
+            print(f"{Colors.YELLOW}⚠ Section '{name}' attempt {attempt + 1} failed: {error}{Colors.END}")
+        return None, error
+
+    def _check_section(self, name: str, fragment) -> str:
+        """Local structural check of a section fragment; returns error text or None"""
+        if not isinstance(fragment, dict):
+            return "response is not a YAML mapping"
+        for key in PARALLEL_SECTIONS[name]:
+            if key not in fragment:
+                return f"missing '{key}'"
+
+        constraints = self._section_constraints()
+        if name == 'skills':
+            expected = constraints.get('skills', {}).get('exact_categories', 7)
+            skills = fragment['skills']
+            if not isinstance(skills, list) or len(skills) != expected:
+                return f"expected {expected} skill categories"
+            if any(not isinstance(s, dict) or 'category' not in s or 'items' not in s for s in skills):
+                return "each skill needs 'category' and 'items'"
+        elif name in ('lseg', 'infosys'):
+            company = LSEG_COMPANY if name == 'lseg' else INFOSYS_COMPANY
+            expected = constraints.get('experience', {}).get('companies', {}).get(company, {}).get('exact_bullets')
+            bullets = fragment['bullets']
+            if not isinstance(bullets, list) or (expected and len(bullets) != expected):
+                return f"expected {expected} bullets"
+        elif name == 'projects':
+            projects_c = constraints.get('projects', {})
+            expected = projects_c.get('exact_count', 3)
+            projects = fragment['projects']
+            if not isinstance(projects, list) or len(projects) != expected:
+                return f"expected {expected} projects"
+            for project in projects:
+                missing = [f for f in projects_c.get('required_fields', []) if f not in project]
+                if missing:
+                    return f"project missing fields: {', '.join(missing)}"
+        return None
+
+    def _assemble_yaml(self, sections: dict) -> str:
+        """Assemble section fragments into the full resume YAML"""
+        constraints = self._section_constraints()
+        header_c = constraints.get('header', {})
+        companies = constraints.get('experience', {}).get('companies', {})
+
+        def experience_entry(company: str, bullets: list) -> dict:
+            entry = {'company': company}
+            entry.update(companies.get(company, {}).get('required_fields', {}))
+            entry['bullets'] = bullets
+            return entry
+
+        data = {
+            'header': {
+                'name': header_c.get('name_exact', ''),
+                'title': sections['summary']['title'],
+                'contact': header_c.get('contact_exact', ''),
+            },
+            'company_name': self.company_name,
+            'summary': sections['summary']['summary'],
+            'skills': sections['skills']['skills'],
+            'experience': [
+                experience_entry(LSEG_COMPANY, sections['lseg']['bullets']),
+                experience_entry(INFOSYS_COMPANY, sections['infosys']['bullets']),
+            ],
+            'projects': sections['projects']['projects'],
+        }
+        return yaml.safe_dump(data, sort_keys=False, allow_unicode=True, width=1000)
+
+    def generate_yaml_parallel(self) -> str:
+        """Generate YAML with one concurrent request per section (fan-out mode)
+
+        Latency is bounded by the slowest section instead of one long
+        serial completion. Sections are checked and assembled locally.
+        """
+        prompts = self._build_section_prompts()
+
+        print(f"\n{Colors.BLUE}Generating {len(prompts)} sections in parallel: {', '.join(prompts)}...{Colors.END}")
+        print(f"{Colors.BLUE}This may take 20-40 seconds...{Colors.END}\n")
+
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            futures = {name: executor.submit(self._generate_section, name, prompt)
+                       for name, prompt in prompts.items()}
+            results = {name: future.result() for name, future in futures.items()}
+
+        sections = {}
+        failed = False
+        for name, (fragment, error) in results.items():
+            if fragment is None:
+                print(f"{Colors.RED}✗ Section '{name}' failed: {error}{Colors.END}")
+                failed = True
+            else:
+                print(f"{Colors.GREEN}✓ Section '{name}' generated{Colors.END}")
+                sections[name] = fragment
+
+        if failed:
+            return None
+
+        return self._assemble_yaml(sections)
     
     def _extract_company_name(self) -> str:
         """Extract company name from JD using AI"""
@@ -350,13 +590,15 @@ Company name:"""
             print(generated_yaml)
             return False
     
-    def run(self, jd_text: str = None, jd_file: str = None, auto_save: bool = False):
+    def run(self, jd_text: str = None, jd_file: str = None, auto_save: bool = False,
+            parallel: bool = False):
         """Run the complete generation process
 
         Args:
             jd_text: Job description text
             jd_file: Path to JD file
             auto_save: If True, save without prompting (for automated pipelines)
+            parallel: If True, generate sections concurrently (fan-out mode)
         """
         print(f"\n{Colors.BOLD}{'=' * 80}{Colors.END}")
         print(f"{Colors.BOLD}YAML RESUME GENERATOR{Colors.END}")
@@ -387,7 +629,10 @@ Company name:"""
                     return False
         
         # Generate YAML
-        generated_yaml = self.generate_yaml()
+        if parallel:
+            generated_yaml = self.generate_yaml_parallel()
+        else:
+            generated_yaml = self.generate_yaml()
         
         if not generated_yaml:
             print(f"{Colors.RED}Failed to generate YAML{Colors.END}")
@@ -453,6 +698,7 @@ Examples:
   python generator.py --jd-file job_description.txt      # From file
   python generator.py --jd "ServiceNow seeks..."         # Direct text
   python generator.py --company "ServiceNow"             # Interactive with company
+  python generator.py --jd-file jd.txt --parallel        # Parallel per-section generation
         """
     )
     
@@ -462,12 +708,14 @@ Examples:
                        help='Path to job description file')
     parser.add_argument('--company', type=str,
                        help='Company name (for summary generation)')
+    parser.add_argument('--parallel', action='store_true',
+                       help='Generate sections concurrently (latency bounded by slowest section)')
     
     args = parser.parse_args()
     
     # Run generator
     generator = YAMLGenerator(company_name=args.company)
-    success = generator.run(jd_text=args.jd, jd_file=args.jd_file)
+    success = generator.run(jd_text=args.jd, jd_file=args.jd_file, parallel=args.parallel)
     
     sys.exit(0 if success else 1)
 
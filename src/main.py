@@ -15,6 +15,7 @@ Usage:
     python main.py --company "Google"       # Override company detection
     python main.py --skip-quality --skip-ats  # Quick generation only
     python main.py --skip-yaml-generation   # Use existing YAML (skip auto-gen)
+    python main.py --parallel-generation    # Generate YAML sections concurrently
 """
 
 import sys
@@ -57,13 +58,14 @@ def close_all_word_applications():
 class ResumePipeline:
     def __init__(self, jd_file=None, company=None, skip_yaml_generation=False,
                  skip_validation=False, skip_generation=False, skip_quality=False, skip_ats=False,
-                 max_revision_attempts=5):
+                 max_revision_attempts=5, parallel_generation=False):
         self.script_dir = Path(__file__).parent.resolve()
         self.project_root = self.script_dir.parent
 
         self.jd_file = jd_file
         self.company = company
         self.skip_yaml_generation = skip_yaml_generation
+        self.parallel_generation = parallel_generation
         self.max_revision_attempts = max_revision_attempts
 
         self.skip_validation = skip_validation
@@ -138,7 +140,8 @@ class ResumePipeline:
                     jd_path = str(default_jd)
 
             # Run generation with auto-save (no prompts in automated pipeline)
-            success = generator.run(jd_file=jd_path, auto_save=True)
+            success = generator.run(jd_file=jd_path, auto_save=True,
+                                    parallel=self.parallel_generation)
 
             if success:
                 self.yaml_generation_passed = True
@@ -636,6 +639,7 @@ Examples:
   python main.py                                      # Uses config/current_jd.txt
   python main.py --jd-file path/to/jd.txt             # Custom JD file
   python main.py --company "Google"                   # Override company detection
+  python main.py --parallel-generation                # Per-section concurrent generation
 
   # Quick generation (skip checkers)
   python main.py --skip-quality --skip-ats            # Faster, no analysis
@@ -654,6 +658,8 @@ Examples:
                        help='Job description file path (default: config/current_jd.txt)')
     parser.add_argument('--company', type=str,
                        help='Company name (auto-detected from JD if not provided)')
+    parser.add_argument('--parallel-generation', action='store_true',
+                       help='Generate YAML sections concurrently instead of one long completion')
 
     # Skip options
     parser.add_argument('--skip-yaml-generation', action='store_true',
@@ -677,7 +683,8 @@ Examples:
         skip_validation=args.skip_validation,
         skip_generation=args.skip_generation,
         skip_quality=args.skip_quality,
-        skip_ats=args.skip_ats
+        skip_ats=args.skip_ats,
+        parallel_generation=args.parallel_generation
     )
 
     success = pipeline.run()